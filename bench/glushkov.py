@@ -0,0 +1,33 @@
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.glushkov import Glushkov
+from lib.regex import Regex
+from lib.table import DfaTable
+
+
+CASES = [
+    ("[a-z0-9_]+@[a-z]+\\.(com|org|net)", "john_doe99@example.com"),
+    ("\\d+-\\d+-\\d+",                    "2026-10-19"),
+    ("(a|b)*a(a|b)(a|b)(a|b)(a|b)",       "abbabababbbabaabbbab"),
+    ("[a-z]*x[a-z]*",                     "abcdefghijklmnopqrstuvwyxz"),
+]
+RUNS   = 100000
+REPEAT = 7
+
+
+if __name__ == "__main__":
+    for pattern, s in CASES:
+        glushkov = Glushkov.from_regex(Regex(pattern))
+        table    = DfaTable.from_glushkov(Glushkov.from_regex(Regex(pattern)))
+        assert glushkov.match(s) == table.match(s)
+
+        # interleave the two engines so that machine noise hits both equally
+        g = t = float("inf")
+        for _ in range(REPEAT):
+            g = min(g, timeit.timeit(lambda: glushkov.match(s), number = RUNS))
+            t = min(t, timeit.timeit(lambda: table.match(s), number = RUNS))
+        print(f"{pattern:40} glushkov {g:.3f}s  table {t:.3f}s  ({t / g:.2f}x)")
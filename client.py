@@ -0,0 +1,44 @@
+import json
+import os
+import socket
+import stat
+import sys
+
+
+def fallback():
+    # no usable daemon, run in-process instead
+    os.execv(sys.executable, [sys.executable, "main.py", *sys.argv[1:]])
+
+
+# Kept free of lib imports so that a call served by the daemon only pays for
+# interpreter startup.
+if __name__ == "__main__":
+    # first 2 args will be client.py and {path}/rexer
+    args = sys.argv[2:]
+    path = os.environ["REXER_SOCKET"]
+
+    # never send input to a socket another user could have put in place
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        fallback()
+    if st.st_uid != os.getuid() or not stat.S_ISSOCK(st.st_mode):
+        print(f"rexer: ignoring {path}, not a socket owned by this user", file = sys.stderr)
+        fallback()
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        fallback()
+
+    stdin = sys.stdin.read() if len(args) > 0 and args[0] == "--match" else None
+    with conn, conn.makefile('rwb') as f:
+        f.write(json.dumps({"args": args, "stdin": stdin}).encode() + b'\n')
+        f.flush()
+        reply = json.loads(f.readline())
+
+    if "error" in reply:
+        raise Exception(reply["error"])
+
+    print(reply["output"], end = '')
@@ -0,0 +1,80 @@
+from array import array
+from collections.abc import Sequence
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from lib.table import DfaTable
+
+
+# Set once per worker process by attach(), so each task only carries its
+# slice of the input strings and never the table itself.
+worker_table:  DfaTable | None    = None
+worker_memory: list[SharedMemory] = []
+
+
+def publish(cells: array[int]) -> SharedMemory:
+    shm = SharedMemory(create = True, size = max(1, len(cells) * cells.itemsize))
+    shm.buf[:len(cells) * cells.itemsize] = memoryview(cells).cast('B')
+    return shm
+
+
+def attach(alphabet: dict[str, int], classes: int,
+           transitions: tuple[str, int], accepting: tuple[str, int]):
+    global worker_table
+
+    views: list[memoryview] = []
+    for name, length in (transitions, accepting):
+        shm = SharedMemory(name = name)
+        worker_memory.append(shm)
+        views.append(shm.buf[:length * array('i').itemsize].cast('i'))
+
+    worker_table = DfaTable(alphabet, classes, views[0], views[1])
+
+
+def run_chunk(args: tuple[Sequence[str], bool]) -> array[int]:
+    strings, classify = args
+    assert worker_table is not None
+
+    if classify:
+        return array('i', map(worker_table.classify, strings))
+    return array('B', map(worker_table.match, strings))
+
+
+def run_many(table: DfaTable, strings: Sequence[str], classify: bool,
+             processes: int | None, chunksize: int) -> array[int]:
+    if chunksize <= 0:
+        raise Exception("Chunk size must be positive")
+
+    results = array('i' if classify else 'B')
+    if processes == 1 or len(strings) <= chunksize:
+        results.extend(map(table.classify if classify else table.match, strings))
+        return results
+
+    transitions = publish(array('i', table.transitions))
+    accepting   = publish(array('i', table.accepting))
+    try:
+        initargs = (table.alphabet, table.classes,
+                    (transitions.name, len(table.transitions)),
+                    (accepting.name, len(table.accepting)))
+        chunks = ((strings[i:i + chunksize], classify)
+                  for i in range(0, len(strings), chunksize))
+
+        with Pool(processes, initializer = attach, initargs = initargs) as pool:
+            for chunk in pool.imap(run_chunk, chunks):
+                results.extend(chunk)
+    finally:
+        for shm in (transitions, accepting):
+            shm.close()
+            shm.unlink()
+
+    return results
+
+
+def match_many(table: DfaTable, strings: Sequence[str], *,
+               processes: int | None = None, chunksize: int = 65536) -> array[int]:
+    return run_many(table, strings, False, processes, chunksize)
+
+
+def classify_many(table: DfaTable, strings: Sequence[str], *,
+                  processes: int | None = None, chunksize: int = 65536) -> array[int]:
+    return run_many(table, strings, True, processes, chunksize)
@@ -0,0 +1,83 @@
+import json
+import os
+import signal
+import socket
+import sys
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from typing import Any, final, override
+
+from lib.session import Session
+
+
+def socket_path() -> str:
+    runtime = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+    return os.environ.get("REXER_SOCKET", os.path.join(runtime, f"rexer-{os.getuid()}.sock"))
+
+
+class SessionHandler(StreamRequestHandler):
+
+    @override
+    def handle(self):
+        server = self.server
+        assert isinstance(server, SessionServer)
+
+        # connections that send nothing, like the liveness probe in
+        # check_stale(), get no reply
+        if not (line := self.rfile.readline()).strip():
+            return
+
+        try:
+            request: dict[str, Any] = json.loads(line)
+            reply = {"output": server.session.run(request["args"], request.get("stdin"))}
+        except Exception as e:
+            reply = {"error": str(e)}
+        self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+
+@final
+class SessionServer(ThreadingUnixStreamServer):
+
+    daemon_threads = True
+
+    @property
+    def session(self) -> Session:
+        return self.__session
+
+    def __init__(self, path: str):
+        self.__session: Session = Session()
+        super().__init__(path, SessionHandler)
+
+
+def check_stale(path: str):
+    if not os.path.lexists(path):
+        return
+    if os.lstat(path).st_uid != os.getuid():
+        raise Exception(f"{path} is owned by another user")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+    raise Exception(f"A rexer daemon is already listening on {path}")
+
+
+def serve(path: str):
+    check_stale(path)
+
+    # only the owning user may connect to the socket
+    umask = os.umask(0o177)
+    try:
+        server = SessionServer(path)
+    finally:
+        os.umask(umask)
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
@@ -0,0 +1,202 @@
+from typing import Self, assert_never, final, override
+
+from lib.char import CharClass
+from lib.core import Consts, CoreIter
+from lib.quantifier import Quantifier
+from lib.regex import Pattern, Regex, RegexUnion
+
+
+def bits(mask: int) -> list[int]:
+    positions: list[int] = []
+    while mask:
+        low = mask & -mask
+        positions.append(low.bit_length() - 1)
+        mask ^= low
+    return positions
+
+
+@final
+class Glushkov:
+
+    # Bit 0 is the initial position and bit i is the i-th character class of
+    # the regex, so the whole active set of positions fits in one int.
+    MAX_POSITIONS = 512
+    MAX_MEMO      = 4096
+
+    @classmethod
+    def from_regex(cls, regex: Regex) -> Self:
+        return cls(regex)
+
+    @override
+    def __str__(self) -> str:
+        ss: list[str] = []
+        for i, follow in enumerate(self.__follow):
+            line = [self.__class__.__name__, str(i), Consts.OPAREN]
+            if i > 0:
+                line.append(f"Class: {self.__classes[i - 1]}")
+            if follow:
+                line.append("Follows:")
+                CoreIter(bits(follow)).foreach(lambda p: line.append(str(p)))
+            if self.__final & (1 << i):
+                line.append("Final")
+            line.append(Consts.CPAREN)
+            ss.append(' '.join(line))
+        return '\n'.join(ss)
+
+    @override
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def positions(self) -> int:
+        return len(self.__classes)
+
+    @property
+    def start(self) -> int:
+        return 1
+
+    @property
+    def final(self) -> int:
+        return self.__final
+
+    @property
+    def alphabet(self) -> dict[str, int]:
+        return self.__masks
+
+    @property
+    def wildcard(self) -> int:
+        return self.__wildcard
+
+    def __init__(self, regex: Regex):
+        self.__classes: list[CharClass] = []
+        self.__follow:  list[int]       = [0]
+
+        nullable, first, last = self.add_pattern(regex)
+        if len(self.__classes) > self.MAX_POSITIONS:
+            raise Exception(f"Regex has more than {self.MAX_POSITIONS} positions")
+
+        self.__follow[0] |= first
+        self.__final: int = last | (self.start if nullable else 0)
+
+        # One mask per input character, with wildcard positions folded in so
+        # that a single dict lookup yields every position the character enters.
+        self.__wildcard: int            = 0
+        self.__masks:    dict[str, int] = {}
+        for i, chrcls in enumerate(self.__classes, 1):
+            if chrcls.wildcard:
+                self.__wildcard |= 1 << i
+            for ch in chrcls:
+                self.__masks[ch] = self.__masks.get(ch, 0) | (1 << i)
+        for ch in self.__masks:
+            self.__masks[ch] |= self.__wildcard
+
+        # The match loops index this directly, so ASCII characters outside the
+        # alphabet are filled in to avoid taking the slow path on them.
+        self.__lookup: dict[str, int] = {chr(n): self.__wildcard for n in range(128)}
+        self.__lookup.update(self.__masks)
+
+        # Concatenation edges i -> i + 1 are handled with a single shift, only
+        # the remaining edges (loops, unions, skips) need a per-position lookup.
+        # The follow set of each active set seen is memoized, so the hot loop
+        # is two dict lookups plus an and per character.
+        self.__shift:       int            = 0
+        self.__jump_mask:   int            = 0
+        self.__jumps:       dict[int, int] = {}
+        self.__follow_memo: dict[int, int] = {}
+        for i, follow in enumerate(self.__follow):
+            nxt = 1 << (i + 1)
+            if follow & nxt:
+                self.__shift |= nxt
+            if rest := follow & ~nxt:
+                self.__jumps[i] = rest
+                self.__jump_mask |= 1 << i
+
+    def add_pattern(self, pat: Pattern) -> tuple[bool, int, int]:
+        match pat:
+            case CharClass() as c:
+                self.__classes.append(c)
+                self.__follow.append(0)
+                bit = 1 << len(self.__classes)
+                nullable, first, last = False, bit, bit
+            case RegexUnion() as u:
+                n1, f1, l1 = self.add_pattern(u.first)
+                n2, f2, l2 = self.add_pattern(u.second)
+                nullable, first, last = n1 or n2, f1 | f2, l1 | l2
+            case Regex() as r:
+                nullable, first, last = True, 0, 0
+                for p in r.patterns:
+                    pn, pf, pl = self.add_pattern(p)
+                    self.add_follow(last, pf)
+                    if nullable:
+                        first |= pf
+                    last = pl | (last if pn else 0)
+                    nullable = nullable and pn
+            case _:
+                assert_never(pat)
+
+        match pat.quantifier:
+            case Quantifier.ONE:
+                pass
+            case Quantifier.ZERO_OR_ONE:
+                nullable = True
+            case Quantifier.ZERO_OR_MORE:
+                self.add_follow(last, first)
+                nullable = True
+            case Quantifier.ONE_OR_MORE:
+                self.add_follow(last, first)
+            case _:
+                assert_never(pat.quantifier)
+
+        return nullable, first, last
+
+    def add_follow(self, src: int, dst: int):
+        for i in bits(src):
+            self.__follow[i] |= dst
+
+    def follow(self, active: int) -> int:
+        if (follow := self.__follow_memo.get(active)) is not None:
+            return follow
+
+        follow = (active << 1) & self.__shift
+        for i in bits(active & self.__jump_mask):
+            follow |= self.__jumps[i]
+
+        if len(self.__follow_memo) >= self.MAX_MEMO:
+            self.__follow_memo.clear()
+        self.__follow_memo[active] = follow
+        return follow
+
+    def advance(self, active: int, mask: int) -> int:
+        return self.follow(active) & mask
+
+    def step(self, active: int, ch: str) -> int:
+        return self.advance(active, self.__masks.get(ch, self.__wildcard))
+
+    def accepts(self, active: int) -> bool:
+        return active & self.__final != 0
+
+    def match(self, s: str) -> bool:
+        memo, lookup = self.__follow_memo, self.__lookup
+
+        active = self.start
+        for ch in s:
+            try:
+                active = memo[active] & lookup[ch]
+            except KeyError:
+                active = self.step(active, ch)
+            if not active:
+                return False
+        return active & self.__final != 0
+
+    def search(self, s: str) -> bool:
+        memo, lookup, final = self.__follow_memo, self.__lookup, self.__final
+
+        active = start = self.start
+        for ch in s:
+            if active & final:
+                return True
+            try:
+                active = (memo[active] & lookup[ch]) | start
+            except KeyError:
+                active = self.step(active, ch) | start
+        return active & final != 0
@@ -0,0 +1,183 @@
+from collections.abc import Iterable
+from typing import Self, final, override
+
+from lib.core import Consts, CoreIter
+from lib.glushkov import Glushkov
+from lib.regex import Regex
+
+
+type Active = tuple[tuple[int, int], ...]
+
+
+@final
+class Registry:
+
+    # The combined automaton is determinized lazily, one (state, character)
+    # transition at a time, and thrown away when it grows past this size.
+    MAX_STATES = 10000
+
+    @override
+    def __str__(self) -> str:
+        ss = [self.__class__.__name__, Consts.OPAREN]
+        (CoreIter(self.__patterns.items())
+            .foreach(lambda p: ss.append(f"{p[0]}:{p[1]}")))
+        ss.append(Consts.CPAREN)
+        return ' '.join(ss)
+
+    @override
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def patterns(self) -> dict[str, str]:
+        return self.__patterns
+
+    @property
+    def states(self) -> int:
+        return len(self.__states)
+
+    def __init__(self):
+        self.__patterns: dict[str, str] = {}
+
+        # Every add gets a new serial, so cached states never confuse a
+        # removed pattern with a later one of the same name. Removing a
+        # pattern only drops its serial, cached states that still mention it
+        # skip it when stepping and filter it out of their matches.
+        self.__serial:    int                 = 0
+        self.__serials:   dict[str, int]      = {}
+        self.__names:     dict[int, str]      = {}
+        self.__fragments: dict[int, Glushkov] = {}
+
+        # Serials at or above this were added after the cache was built from
+        # scratch. States are ordered by serial, so these always trail the
+        # patterns the cached transitions were computed for.
+        self.__fresh: int = 0
+
+        self.__start:   int | None            = None
+        self.__states:  list[Active]          = []
+        self.__ids:     dict[Active, int]     = {}
+        self.__moves:   list[dict[str, int]]  = []
+        self.__accepts: list[tuple[int, ...]] = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__patterns
+
+    def __len__(self) -> int:
+        return len(self.__patterns)
+
+    def add_pattern(self, name: str, pattern: str):
+        if self.__patterns.get(name) == pattern:
+            return
+
+        fragment = Glushkov.from_regex(Regex(pattern))
+        if name in self.__patterns:
+            self.remove_pattern(name)
+
+        serial = self.__serial
+        self.__serial += 1
+        self.__patterns[name]    = pattern
+        self.__serials[name]     = serial
+        self.__names[serial]     = name
+        self.__fragments[serial] = fragment
+
+        # Cached states stay valid for the patterns they cover, the new
+        # pattern is stepped beside them in move().
+        if self.__start is not None:
+            self.__start = self.state_id(self.__states[self.__start] + ((serial, fragment.start),))
+
+    def remove_pattern(self, name: str):
+        if name not in self.__patterns:
+            raise Exception(f"No pattern named {name!r} in registry")
+
+        serial = self.__serials.pop(name)
+        del self.__patterns[name]
+        del self.__names[serial]
+        del self.__fragments[serial]
+
+    def load(self, patterns: dict[str, str]):
+        # Only patterns whose source changed are recompiled, the rest keep
+        # their fragments and cached transitions.
+        (CoreIter(list(self.__patterns))
+            .filter(lambda name: name not in patterns)
+            .foreach(lambda name: self.remove_pattern(name)))
+        CoreIter(patterns.items()).foreach(lambda p: self.add_pattern(p[0], p[1]))
+
+    def with_pattern(self, name: str, pattern: str) -> Self:
+        self.add_pattern(name, pattern)
+        return self
+
+    def with_patterns(self, patterns: Iterable[tuple[str, str]]) -> Self:
+        CoreIter(patterns).foreach(lambda p: self.add_pattern(p[0], p[1]))
+        return self
+
+    def invalidate(self):
+        self.__start   = None
+        self.__states  = []
+        self.__ids     = {}
+        self.__moves   = []
+        self.__accepts = []
+
+    def state_id(self, active: Active) -> int:
+        if (id := self.__ids.get(active)) is not None:
+            return id
+
+        id = len(self.__states)
+        self.__ids[active] = id
+        self.__states.append(active)
+        self.__moves.append({})
+        self.__accepts.append(tuple(
+            CoreIter(active)
+                .filter(lambda a: a[0] in self.__fragments and self.__fragments[a[0]].accepts(a[1]))
+                .map(lambda a: a[0])))
+        return id
+
+    def start_id(self) -> int:
+        if len(self.__states) > self.MAX_STATES:
+            self.invalidate()
+        if self.__start is None:
+            self.__fresh = self.__serial
+            self.__start = self.state_id(tuple(
+                CoreIter(self.__fragments.items()).map(lambda f: (f[0], f[1].start))))
+        return self.__start
+
+    def move(self, id: int, ch: str) -> int:
+        active = self.__states[id]
+        split  = len(active)
+        while split > 0 and active[split - 1][0] >= self.__fresh:
+            split -= 1
+
+        stepped: list[tuple[int, int]] = []
+        if split < len(active):
+            # Reuse the cached transition of the older patterns and only step
+            # the patterns added since.
+            base = self.state_id(active[:split])
+            nxt  = self.__moves[base].get(ch)
+            stepped.extend(self.__states[nxt if nxt is not None else self.move(base, ch)])
+        else:
+            split = 0
+
+        for serial, positions in active[split:]:
+            if (fragment := self.__fragments.get(serial)) is None:
+                continue
+            if nxt := fragment.step(positions, ch):
+                stepped.append((serial, nxt))
+
+        nxt_id = self.state_id(tuple(stepped))
+        self.__moves[id][ch] = nxt_id
+        return nxt_id
+
+    def run(self, s: str) -> int:
+        state = self.start_id()
+        moves = self.__moves
+        for ch in s:
+            nxt = moves[state].get(ch)
+            state = nxt if nxt is not None else self.move(state, ch)
+        return state
+
+    def matches(self, s: str) -> tuple[str, ...]:
+        # run() may reset the cache, so only look the state up once it returns
+        state = self.run(s)
+        return tuple(self.__names[k] for k in self.__accepts[state] if k in self.__names)
+
+    def match(self, s: str) -> bool:
+        return len(self.matches(s)) > 0
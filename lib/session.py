@@ -0,0 +1,48 @@
+from functools import lru_cache
+from typing import final
+
+from lib.core import CoreIter
+from lib.dfa import Dfa
+from lib.glushkov import Glushkov
+from lib.nfa import Nfa
+from lib.regex import Regex
+
+
+# Compiled automata are kept per pattern source, so a daemon that serves many
+# short invocations only compiles each recently used pattern once.
+CACHE_SIZE = 256
+
+
+@lru_cache(maxsize = CACHE_SIZE)
+def compile_dfa(pattern: str) -> str:
+    return str(Dfa.from_nfa(Nfa().with_regex(Regex(pattern))))
+
+
+@lru_cache(maxsize = CACHE_SIZE)
+def compile_matcher(pattern: str) -> Glushkov:
+    return Glushkov.from_regex(Regex(pattern))
+
+
+@final
+class Session:
+
+    def compile(self, pattern: str) -> str:
+        return compile_dfa(pattern)
+
+    def matcher(self, pattern: str) -> Glushkov:
+        return compile_matcher(pattern)
+
+    def run(self, args: list[str], stdin: str | None) -> str:
+        match args:
+            case []:
+                raise Exception("No arguments to parse")
+            case ["--match", pattern]:
+                matcher = self.matcher(pattern)
+                return ''.join(
+                    CoreIter((stdin or "").splitlines(keepends = True))
+                        .filter(lambda line: matcher.match(line.rstrip('\n')))
+                        .collect(list))
+            case ["--match", *_]:
+                raise Exception("--match takes exactly one pattern")
+            case patterns:
+                return ''.join(CoreIter(patterns).map(lambda p: f"{self.compile(p)}\n"))
@@ -0,0 +1,202 @@
+from array import array
+from collections.abc import Callable
+from typing import Self, final, override
+
+from lib.core import Consts, CoreIter
+from lib.glushkov import Glushkov
+
+
+type Cells = array[int] | memoryview
+
+
+@final
+class DfaTable:
+
+    # State 0 is a sink (the dead state, unless complemented) and state 1 is
+    # the start state. Alphabet class 0 covers every character that is not
+    # listed in the alphabet, so every table is complete.
+    DEAD  = 0
+    START = 1
+    OTHER = 0
+
+    # Determinizing several patterns at once can blow up exponentially, so
+    # construction gives up past this many states.
+    MAX_STATES = 65536
+
+    @classmethod
+    def from_glushkov(cls, *machines: Glushkov) -> Self:
+        if len(machines) == 0:
+            raise Exception("Cannot build a table without any patterns")
+
+        # Characters that enter the same positions in every machine are
+        # indistinguishable, so they share one column of the table.
+        other = tuple(CoreIter(machines).map(lambda m: m.wildcard))
+        columns: dict[tuple[int, ...], int] = {other: cls.OTHER}
+        alphabet: dict[str, int] = {}
+        for ch in sorted({ch for m in machines for ch in m.alphabet}):
+            sig = tuple(CoreIter(machines).map(lambda m: m.alphabet.get(ch, m.wildcard)))
+            alphabet[ch] = columns.setdefault(sig, len(columns))
+
+        dead  = tuple(0 for _ in machines)
+        start = tuple(CoreIter(machines).map(lambda m: m.start))
+        ids: dict[tuple[int, ...], int] = {dead: cls.DEAD, start: cls.START}
+        to_visit = [dead, start]
+
+        transitions = array('i')
+        accepting   = array('i')
+        for active in to_visit:
+            accepting.append(next(
+                (i for i, m in enumerate(machines) if m.accepts(active[i])), -1))
+            for sig in columns:
+                nxt = tuple(m.advance(active[i], sig[i]) for i, m in enumerate(machines))
+                if nxt not in ids:
+                    if len(to_visit) >= cls.MAX_STATES:
+                        raise Exception(f"Table has more than {cls.MAX_STATES} states")
+                    ids[nxt] = len(to_visit)
+                    to_visit.append(nxt)
+                transitions.append(ids[nxt])
+
+        return cls(alphabet, len(columns), transitions, accepting)
+
+    @override
+    def __str__(self) -> str:
+        ss: list[str] = []
+        for state in range(self.states):
+            line = [self.__class__.__name__, str(state), Consts.OPAREN]
+            row  = self.__transitions[state * self.__classes:(state + 1) * self.__classes]
+            line.append("Transitions:")
+            CoreIter(enumerate(row)).foreach(lambda t: line.append(f"{t[0]}->{t[1]}"))
+            if (pattern := self.__accepting[state]) >= 0:
+                line.append(f"Final {pattern}")
+            line.append(Consts.CPAREN)
+            ss.append(' '.join(line))
+        return '\n'.join(ss)
+
+    @override
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def alphabet(self) -> dict[str, int]:
+        return self.__alphabet
+
+    @property
+    def classes(self) -> int:
+        return self.__classes
+
+    @property
+    def states(self) -> int:
+        return len(self.__accepting)
+
+    @property
+    def transitions(self) -> Cells:
+        return self.__transitions
+
+    @property
+    def accepting(self) -> Cells:
+        return self.__accepting
+
+    def __init__(self, alphabet: dict[str, int], classes: int, transitions: Cells, accepting: Cells):
+        assert len(transitions) == classes * len(accepting)
+
+        self.__alphabet:    dict[str, int] = alphabet
+        self.__classes:     int            = classes
+        self.__transitions: Cells          = transitions
+        self.__accepting:   Cells          = accepting
+
+    def run(self, s: str) -> int:
+        alphabet, classes, transitions = self.__alphabet, self.__classes, self.__transitions
+
+        state = self.START
+        for ch in s:
+            state = transitions[state * classes + alphabet.get(ch, self.OTHER)]
+            if state == self.DEAD:
+                break
+        return state
+
+    def match(self, s: str) -> bool:
+        return self.__accepting[self.run(s)] >= 0
+
+    def classify(self, s: str) -> int:
+        return self.__accepting[self.run(s)]
+
+    def align(self, other: "DfaTable") -> tuple[dict[str, int], list[tuple[int, int]]]:
+        columns: dict[tuple[int, int], int] = {(self.OTHER, other.OTHER): self.OTHER}
+        alphabet: dict[str, int] = {}
+        for ch in sorted(self.__alphabet.keys() | other.alphabet.keys()):
+            pair = (self.__alphabet.get(ch, self.OTHER), other.alphabet.get(ch, other.OTHER))
+            alphabet[ch] = columns.setdefault(pair, len(columns))
+        return alphabet, list(columns)
+
+    def product(self, other: "DfaTable", op: Callable[[bool, bool], bool]) -> "DfaTable":
+        alphabet, columns = self.align(other)
+        ids: dict[tuple[int, int], int] = {(self.DEAD, other.DEAD): self.DEAD,
+                                           (self.START, other.START): self.START}
+        to_visit = [(self.DEAD, other.DEAD), (self.START, other.START)]
+
+        transitions = array('i')
+        accepting   = array('i')
+        for a, b in to_visit:
+            accepting.append(0 if op(self.__accepting[a] >= 0, other.accepting[b] >= 0) else -1)
+            for ca, cb in columns:
+                nxt = (self.__transitions[a * self.__classes + ca],
+                       other.transitions[b * other.classes + cb])
+                if nxt not in ids:
+                    ids[nxt] = len(to_visit)
+                    to_visit.append(nxt)
+                transitions.append(ids[nxt])
+
+        return DfaTable(alphabet, len(columns), transitions, accepting)
+
+    def find_product(self, other: "DfaTable", op: Callable[[bool, bool], bool]) -> bool:
+        # Same exploration as product() but without building the table, and
+        # stopping at the first reachable pair that op accepts.
+        _, columns = self.align(other)
+        visited  = {(self.START, other.START)}
+        to_visit = [(self.START, other.START)]
+        while len(to_visit) > 0:
+            a, b = to_visit.pop()
+            if op(self.__accepting[a] >= 0, other.accepting[b] >= 0):
+                return True
+            for ca, cb in columns:
+                nxt = (self.__transitions[a * self.__classes + ca],
+                       other.transitions[b * other.classes + cb])
+                if nxt not in visited:
+                    visited.add(nxt)
+                    to_visit.append(nxt)
+        return False
+
+    def intersection(self, other: "DfaTable") -> "DfaTable":
+        return self.product(other, lambda a, b: a and b)
+
+    def union(self, other: "DfaTable") -> "DfaTable":
+        return self.product(other, lambda a, b: a or b)
+
+    def difference(self, other: "DfaTable") -> "DfaTable":
+        return self.product(other, lambda a, b: a and not b)
+
+    def complement(self) -> "DfaTable":
+        accepting = array('i', CoreIter(self.__accepting).map(lambda p: -1 if p >= 0 else 0))
+        return DfaTable(dict(self.__alphabet), self.__classes, array('i', self.__transitions), accepting)
+
+    def is_empty(self) -> bool:
+        visited  = {self.START}
+        to_visit = [self.START]
+        while len(to_visit) > 0:
+            state = to_visit.pop()
+            if self.__accepting[state] >= 0:
+                return False
+            for nxt in self.__transitions[state * self.__classes:(state + 1) * self.__classes]:
+                if nxt not in visited:
+                    visited.add(nxt)
+                    to_visit.append(nxt)
+        return True
+
+    def intersects(self, other: "DfaTable") -> bool:
+        return self.find_product(other, lambda a, b: a and b)
+
+    def is_subset(self, other: "DfaTable") -> bool:
+        return not self.find_product(other, lambda a, b: a and not b)
+
+    def is_equivalent(self, other: "DfaTable") -> bool:
+        return not self.find_product(other, lambda a, b: a != b)
@@ -1,9 +1,6 @@
 import sys
 
-from lib.core import CoreIter
-from lib.dfa import Dfa
-from lib.nfa import Nfa
-from lib.regex import Regex
+from lib.session import Session
 
 
 if __name__ == "__main__":
@@ -11,8 +8,11 @@ if __name__ == "__main__":
     if len(sys.argv) < 3:
         raise Exception("No arguments to parse")
 
-    (CoreIter(sys.argv[2:])
-        .map(lambda s: Regex(s))
-        .map(lambda r: Nfa().with_regex(r))
-        .map(lambda s: Dfa.from_nfa(s))
-        .foreach(lambda s: print(s)))
+    args = sys.argv[2:]
+    if args == ["--daemon"]:
+        # only the daemon needs the socket server
+        from lib.daemon import serve, socket_path
+        serve(socket_path())
+    else:
+        stdin = sys.stdin.read() if args[0] == "--match" else None
+        print(Session().run(args, stdin), end = '')
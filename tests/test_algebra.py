@@ -0,0 +1,56 @@
+import itertools
+import re
+
+import pytest
+
+from lib.glushkov import Glushkov
+from lib.regex import Regex
+from lib.table import DfaTable
+
+
+PATTERNS = ['a*b', '(ab)*', 'a|ab', 'a[bc]d', '(a|b)*c', '\\d+', 'b|aa*b', 'a.d', 'a?', '(a|b)*']
+WORDS    = [''.join(w) for n in range(5) for w in itertools.product('abcdx1', repeat = n)]
+PAIRS    = list(itertools.product(PATTERNS, repeat = 2))
+
+
+def table(pattern: str) -> DfaTable:
+    return DfaTable.from_glushkov(Glushkov.from_regex(Regex(pattern)))
+
+
+def language(pattern: str) -> set[str]:
+    return {w for w in WORDS if re.fullmatch(pattern, w)}
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_complement(pattern: str):
+    t, lang = table(pattern).complement(), language(pattern)
+    for w in WORDS:
+        assert t.match(w) == (w not in lang), w
+    assert t.match('€')
+
+
+@pytest.mark.parametrize("first, second", PAIRS)
+def test_products(first: str, second: str):
+    a, b     = table(first), table(second)
+    la, lb   = language(first), language(second)
+    products = [(a.intersection(b), la & lb), (a.union(b), la | lb), (a.difference(b), la - lb)]
+    for t, lang in products:
+        for w in WORDS:
+            assert t.match(w) == (w in lang), w
+
+
+@pytest.mark.parametrize("first, second", PAIRS)
+def test_checks_agree_with_products(first: str, second: str):
+    a, b = table(first), table(second)
+    assert a.intersects(b) == (not a.intersection(b).is_empty())
+    assert a.is_subset(b) == a.difference(b).is_empty()
+    assert a.is_equivalent(b) == (a.is_subset(b) and b.is_subset(a))
+
+
+def test_subset_and_equivalence():
+    assert table('a*b').is_equivalent(table('b|aa*b'))
+    assert not table('a*b').is_equivalent(table('a+b'))
+    assert table('a[bc]d').is_subset(table('a.d'))
+    assert not table('a.d').is_subset(table('a[bc]d'))
+    assert table('(a|b)*').complement().intersection(table('(a|b)*')).is_empty()
+    assert not table('a').is_empty()
@@ -0,0 +1,32 @@
+import itertools
+import re
+
+from lib.batch import classify_many, match_many
+from lib.glushkov import Glushkov
+from lib.regex import Regex
+from lib.table import DfaTable
+
+
+PATTERNS = ['a*b', '(ab)*', 'a|ab', 'a[bc]d', '(a|b)*c', '\\d+']
+WORDS    = [''.join(w) for n in range(5) for w in itertools.product('abcd1', repeat = n)]
+TABLE    = DfaTable.from_glushkov(*(Glushkov.from_regex(Regex(p)) for p in PATTERNS))
+
+
+def classify(s: str) -> int:
+    return next((i for i, p in enumerate(PATTERNS) if re.fullmatch(p, s)), -1)
+
+
+def test_classify_many_keeps_input_order():
+    results = classify_many(TABLE, WORDS, processes = 3, chunksize = 50)
+    assert results.typecode == 'i'
+    assert list(results) == [classify(w) for w in WORDS]
+
+
+def test_match_many_keeps_input_order():
+    results = match_many(TABLE, WORDS, processes = 3, chunksize = 50)
+    assert results.typecode == 'B'
+    assert list(results) == [int(classify(w) >= 0) for w in WORDS]
+
+
+def test_single_process():
+    assert list(classify_many(TABLE, WORDS, processes = 1)) == [classify(w) for w in WORDS]
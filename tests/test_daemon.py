@@ -0,0 +1,96 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def rexer(script: str, args: list[str], path: Path, stdin: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, script, "rexer", *args], cwd = ROOT, input = stdin, text = True,
+        capture_output = True, env = {**os.environ, "REXER_SOCKET": str(path)}, timeout = 30)
+
+
+def request(path: Path, payload: bytes) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(path))
+        conn.sendall(payload)
+        conn.shutdown(socket.SHUT_WR)
+        return conn.makefile('rb').read()
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> Iterator[tuple[Path, subprocess.Popen[str]]]:
+    path = tmp_path / "rexer.sock"
+    proc = subprocess.Popen(
+        [sys.executable, "main.py", "rexer", "--daemon"], cwd = ROOT, text = True,
+        stderr = subprocess.PIPE, env = {**os.environ, "REXER_SOCKET": str(path)})
+
+    deadline = time.monotonic() + 10
+    while not path.exists():
+        assert proc.poll() is None and time.monotonic() < deadline
+        time.sleep(0.05)
+
+    yield path, proc
+
+    proc.terminate()
+    proc.wait(timeout = 10)
+    assert not path.exists()
+
+
+def test_client_output_matches_in_process(daemon: tuple[Path, subprocess.Popen[str]]):
+    path, _ = daemon
+    for args, stdin in [(["abc", "a[bc]d"], ""), (["--match", "a*b"], "ab\nx\naab\n")]:
+        local  = rexer("main.py", args, path, stdin)
+        remote = rexer("client.py", args, path, stdin)
+        assert remote.returncode == local.returncode == 0
+        assert remote.stdout == local.stdout
+
+
+def test_client_reports_errors(daemon: tuple[Path, subprocess.Popen[str]]):
+    path, _ = daemon
+    result = rexer("client.py", ["--match"], path)
+    assert result.returncode != 0
+    assert "--match takes exactly one pattern" in result.stderr
+
+
+def test_bad_requests(daemon: tuple[Path, subprocess.Popen[str]]):
+    path, proc = daemon
+    assert request(path, b"") == b""
+    assert "error" in json.loads(request(path, b"not json\n"))
+    assert "output" in json.loads(request(path, json.dumps({"args": ["abc"]}).encode() + b"\n"))
+
+    proc.terminate()
+    _, stderr = proc.communicate(timeout = 10)
+    assert "Traceback" not in stderr
+
+
+def test_second_daemon_refuses_to_start(daemon: tuple[Path, subprocess.Popen[str]]):
+    path, proc = daemon
+    result = rexer("main.py", ["--daemon"], path)
+    assert result.returncode != 0
+    assert "already listening" in result.stderr
+    assert path.exists()
+
+    # the liveness probe must not show up as a failed request in the daemon
+    proc.terminate()
+    _, stderr = proc.communicate(timeout = 10)
+    assert "Traceback" not in stderr
+
+
+def test_stale_socket_falls_back(tmp_path: Path):
+    path = tmp_path / "rexer.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(path))
+
+    result = rexer("client.py", ["--match", "a*b"], path, "ab\nx\n")
+    assert result.returncode == 0
+    assert result.stdout == "ab\n"
@@ -0,0 +1,48 @@
+import itertools
+import random
+import re
+
+import pytest
+
+from lib.glushkov import Glushkov
+from lib.regex import Regex
+
+
+PATTERNS = ['a*b', '(ab)*', 'a|ab', 'a[bc]d', '(a|b)*c', 'x.y', '\\d+', '(ab|c)+d?',
+            'a?b?c?', '', '(a(b|c)*)+', '[a-c]*b[a-c]']
+WORDS    = [''.join(w) for n in range(5) for w in itertools.product('abcdxy1', repeat = n)]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_match(pattern: str):
+    glushkov = Glushkov.from_regex(Regex(pattern))
+    for w in WORDS:
+        assert glushkov.match(w) == (re.fullmatch(pattern, w) is not None), w
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_search(pattern: str):
+    glushkov = Glushkov.from_regex(Regex(pattern))
+    for w in WORDS:
+        assert glushkov.search(w) == (re.search(pattern, w) is not None), w
+
+
+def test_non_ascii():
+    glushkov = Glushkov.from_regex(Regex('é.ß'))
+    assert glushkov.match('é€ß')
+    assert not glushkov.match('e€ß')
+
+
+def test_too_many_positions():
+    with pytest.raises(Exception):
+        Glushkov.from_regex(Regex('a' * (Glushkov.MAX_POSITIONS + 1)))
+
+
+def test_memo_is_bounded():
+    pattern  = '(a|b)*a' + '(a|b)' * 18
+    glushkov = Glushkov.from_regex(Regex(pattern))
+    rng      = random.Random(0)
+    for _ in range(300):
+        w = ''.join(rng.choice('ab') for _ in range(100))
+        assert glushkov.match(w) == (re.fullmatch(pattern, w) is not None)
+    assert len(glushkov._Glushkov__follow_memo) <= Glushkov.MAX_MEMO
@@ -0,0 +1,97 @@
+import itertools
+import random
+import re
+
+import pytest
+
+from lib.registry import Registry
+
+
+PATTERNS = {f"r{i}": p for i, p in enumerate(
+    ['a*b', '(ab)*', 'a|ab', 'a[bc]d', '(a|b)*c', 'x.y', '\\d+', '(ab|c)+d?'])}
+WORDS    = [''.join(w) for n in range(5) for w in itertools.product('abcdxy1', repeat = n)]
+
+
+def check(registry: Registry):
+    for w in WORDS:
+        expected = tuple(name for name, p in registry.patterns.items() if re.fullmatch(p, w))
+        assert registry.matches(w) == expected, w
+
+
+def test_matches():
+    check(Registry().with_patterns(PATTERNS.items()))
+
+
+def test_add_and_remove_keep_cache_consistent():
+    registry = Registry().with_patterns(PATTERNS.items())
+    check(registry)
+    cached = registry.states
+
+    registry.remove_pattern('r3')
+    assert 0 < registry.states <= cached
+    check(registry)
+
+    registry.add_pattern('new', 'd+')
+    registry.add_pattern('r0', 'b+')
+    check(registry)
+
+    with pytest.raises(Exception):
+        registry.remove_pattern('r3')
+
+
+def test_load_only_recompiles_changed_patterns():
+    registry = Registry().with_patterns(PATTERNS.items())
+    check(registry)
+    serial   = registry._Registry__serials['r1']
+
+    rules = dict(PATTERNS)
+    del rules['r2']
+    rules['r5'] = 'y+'
+    rules['z']  = '1?'
+    registry.load(rules)
+
+    assert registry.patterns == rules
+    assert registry._Registry__serials['r1'] == serial
+    check(registry)
+
+
+def test_random_edits():
+    rng      = random.Random(0)
+    pool     = ['a*b', 'ab', 'a|b', '[a-c]+', 'x?y', '\\d*', '(a|b)*c', '.b']
+    registry = Registry()
+    for step in range(40):
+        if len(registry) > 0 and rng.random() < 0.4:
+            registry.remove_pattern(rng.choice(list(registry.patterns)))
+        else:
+            registry.add_pattern(f"p{rng.randrange(10)}", rng.choice(pool))
+        for w in rng.sample(WORDS, 200):
+            expected = tuple(name for name, p in registry.patterns.items() if re.fullmatch(p, w))
+            assert registry.matches(w) == expected, (step, w)
+
+
+def test_cache_reset_past_max_states(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Registry, "MAX_STATES", 20)
+    rng      = random.Random(1)
+    pool     = ['(a|b)*a(a|b)(a|b)', 'a*b', '[a-c]+', '(ab|c)+d?', '.b', '\\d*']
+    registry = Registry()
+    for step in range(60):
+        if len(registry) > 0 and rng.random() < 0.3:
+            registry.remove_pattern(rng.choice(list(registry.patterns)))
+        else:
+            registry.add_pattern(f"p{rng.randrange(6)}", rng.choice(pool))
+        for w in rng.sample(WORDS, 50):
+            expected = tuple(name for name, p in registry.patterns.items() if re.fullmatch(p, w))
+            assert registry.matches(w) == expected, (step, w)
+
+
+def test_add_reuses_cached_transitions():
+    registry = Registry().with_patterns(PATTERNS.items())
+    check(registry)
+    registry.add_pattern('new', 'd+')
+
+    # patterns cached before the add are no longer fresh, so their
+    # transitions are looked up instead of stepped again
+    fresh = registry._Registry__fresh
+    assert fresh == registry._Registry__serials['new']
+    assert all(registry._Registry__serials[name] < fresh for name in PATTERNS)
+    check(registry)
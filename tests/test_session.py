@@ -0,0 +1,27 @@
+import pytest
+
+from lib.dfa import Dfa
+from lib.nfa import Nfa
+from lib.regex import Regex
+from lib.session import Session
+
+
+def test_compile_matches_baseline_output():
+    patterns = ['abc', 'a[bc]d']
+    expected = ''.join(f"{Dfa.from_nfa(Nfa().with_regex(Regex(p)))}\n" for p in patterns)
+    assert Session().run(patterns, None) == expected
+
+
+def test_match_filters_lines():
+    stdin = "ab\nb\nx\naab\nabx"
+    assert Session().run(["--match", "a*b"], stdin) == "ab\nb\naab\n"
+
+
+def test_match_without_input():
+    assert Session().run(["--match", "a*b"], None) == ""
+
+
+@pytest.mark.parametrize("args", [[], ["--match"], ["--match", "a", "b"]])
+def test_bad_arguments(args: list[str]):
+    with pytest.raises(Exception):
+        Session().run(args, None)
@@ -0,0 +1,43 @@
+import itertools
+import re
+
+import pytest
+
+from lib.glushkov import Glushkov
+from lib.regex import Regex
+from lib.table import DfaTable
+
+
+PATTERNS = ['a*b', '(ab)*', 'a|ab', 'a[bc]d', '(a|b)*c', 'x.y', '\\d+', '(ab|c)+d?']
+WORDS    = [''.join(w) for n in range(5) for w in itertools.product('abcdxy1', repeat = n)]
+
+
+def table(*patterns: str) -> DfaTable:
+    return DfaTable.from_glushkov(*(Glushkov.from_regex(Regex(p)) for p in patterns))
+
+
+def classify(patterns: list[str], s: str) -> int:
+    return next((i for i, p in enumerate(patterns) if re.fullmatch(p, s)), -1)
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_match(pattern: str):
+    t = table(pattern)
+    for w in WORDS:
+        assert t.match(w) == (re.fullmatch(pattern, w) is not None), w
+
+
+def test_classify_returns_first_matching_pattern():
+    t = table(*PATTERNS)
+    for w in WORDS:
+        assert t.classify(w) == classify(PATTERNS, w), w
+
+
+def test_no_patterns():
+    with pytest.raises(Exception):
+        DfaTable.from_glushkov()
+
+
+def test_too_many_states():
+    with pytest.raises(Exception):
+        table(*(f".*{ch}xyz.*" for ch in "abcdefghijklmnop"))